@@ -7,7 +7,7 @@ from .brar import brar
 from .cci import cci
 from .cfo import cfo
 from .cg import cg
-from .cmo import cmo
+from .cmo import cmo, cmo_batch
 from .coppock import coppock
 from .cti import cti
 from .dm import dm
@@ -19,7 +19,7 @@ from .kdj import kdj
 from .kst import kst
 from .macd import macd
 from .mom import mom
-from .pgo import pgo
+from .pgo import pgo, pgo_batch
 from .ppo import ppo
 from .psl import psl
 from .pvo import pvo
@@ -1,7 +1,58 @@
 # -*- coding: utf-8 -*-
+from numpy import ascontiguousarray as npAscontiguousarray
+from numpy import empty_like as npEmptyLike
+from numpy import errstate as npErrstate
+from numpy import float64 as npFloat64
+from numpy import full as npFull
+from numpy import maximum as npMaximum
+from numpy import nan as npNaN
+from pandas import DataFrame, Series
 from pandas_ta import Imports
-from pandas_ta.overlap import rma
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta.utils import fast_fillna, fast_shift, get_drift, get_offset, njit, prange, ro_float64_1d, verify_series
+
+
+@njit(f"float64[:]({ro_float64_1d}, int64, int64, float64)", cache=True)
+def _cmo_wilder_loop(close, length, drift, scalar):
+    """CMO with Wilder smoothed gains and losses in a single pass. The
+    smoothing matches rma(): close.ewm(alpha=1 / length, min_periods=length).
+    Like close.diff(drift), a negative drift takes forward differences."""
+    m = close.size
+    result = npFull(m, npNaN)
+    inv_n = 1.0 / length
+    decay = 1.0 - inv_n
+
+    pos = neg = weight = 0.0
+    nobs = 0
+    for i in range(m):
+        j = i - drift
+        mom = close[i] - close[j] if 0 <= j < m else npNaN
+        if mom == mom:
+            p = mom if mom > 0 else 0.0
+            n = -mom if mom < 0 else 0.0
+            if nobs == 0:
+                pos, neg, weight = p, n, 1.0
+            else:
+                weight *= decay
+                inv_w = 1.0 / (weight + 1)
+                pos = (weight * pos + p) * inv_w
+                neg = (weight * neg + n) * inv_w
+                weight += 1
+            nobs += 1
+        elif nobs > 0:
+            weight *= decay
+
+        if nobs >= length and pos + neg != 0:
+            result[i] = scalar * (pos - neg) / (pos + neg)
+    return result
+
+
+@njit(parallel=True, cache=True)
+def _cmo_batch(close, length, drift, scalar):
+    """Wilder smoothed CMO for each row of a 2D array, rows computed in parallel"""
+    result = npEmptyLike(close)
+    for s in prange(close.shape[0]):
+        result[s] = _cmo_wilder_loop(close[s], length, drift, scalar)
+    return result
 
 
 def cmo(close, length=None, scalar=None, talib=None, drift=None, offset=None, **kwargs):
@@ -20,29 +71,40 @@ def cmo(close, length=None, scalar=None, talib=None, drift=None, offset=None, **
     if Imports["talib"] and mode_tal:
         from talib import CMO
         cmo = CMO(close, length)
+    elif mode_tal:
+        cmo = _cmo_wilder_loop(close.to_numpy(dtype=npFloat64), length, drift, scalar)
+        cmo = Series(cmo, index=close.index)
     else:
-        mom = close.diff(drift)
-        positive = mom.copy().clip(lower=0)
-        negative = mom.copy().clip(upper=0).abs()
-
-        if mode_tal:
-            pos_ = rma(positive, length)
-            neg_ = rma(negative, length)
+        values = close.to_numpy(dtype=npFloat64)
+        m = values.size
+        mom = npFull(m, npNaN)
+        if 0 < drift < m:
+            mom[drift:] = values[drift:] - values[:-drift]
+        elif 0 < -drift < m:
+            mom[:drift] = values[:drift] - values[-drift:]
+        positive = npMaximum(mom, 0)
+        negative = npMaximum(-mom, 0)
+
+        if Imports["bottleneck"]:
+            from bottleneck import move_sum
+            pos_ = move_sum(positive, length, min_count=length)
+            neg_ = move_sum(negative, length, min_count=length)
         else:
-            pos_ = positive.rolling(length).sum()
-            neg_ = negative.rolling(length).sum()
+            pos_ = Series(positive).rolling(length).sum().to_numpy()
+            neg_ = Series(negative).rolling(length).sum().to_numpy()
 
-        cmo = scalar * (pos_ - neg_) / (pos_ + neg_)
+        with npErrstate(divide="ignore", invalid="ignore"):
+            cmo = Series(scalar * (pos_ - neg_) / (pos_ + neg_), index=close.index)
 
     # Offset
     if offset != 0:
-        cmo = cmo.shift(offset)
+        cmo = fast_shift(cmo, offset)
 
     # Handle fills
     if "fillna" in kwargs:
-        cmo.fillna(kwargs["fillna"], inplace=True)
+        cmo = fast_fillna(cmo, kwargs["fillna"])
     if "fill_method" in kwargs:
-        cmo.fillna(method=kwargs["fill_method"], inplace=True)
+        cmo = fast_fillna(cmo, method=kwargs["fill_method"])
 
     # Name and Categorize it
     cmo.name = f"CMO_{length}"
@@ -85,3 +147,61 @@ Kwargs:
 Returns:
     pd.Series: New feature generated.
 """
+
+
+def cmo_batch(close, length=None, scalar=None, drift=None, offset=None, **kwargs):
+    """Indicator: Chande Momentum Oscillator (CMO) for each column"""
+    # Validate Arguments
+    length = int(length) if length and length > 0 else 14
+    scalar = float(scalar) if scalar else 100
+    drift = get_drift(drift)
+    offset = get_offset(offset)
+
+    if not isinstance(close, DataFrame) or close.shape[0] < length: return
+
+    # Calculate Result
+    values = npAscontiguousarray(close.to_numpy(dtype=npFloat64).T)
+    cmo = _cmo_batch(values, length, drift, scalar)
+    cmo = DataFrame(cmo.T, index=close.index, columns=close.columns)
+
+    # Offset
+    if offset != 0:
+        cmo = cmo.shift(offset)
+
+    # Handle fills
+    if "fillna" in kwargs:
+        cmo = fast_fillna(cmo, kwargs["fillna"])
+    if "fill_method" in kwargs:
+        cmo = fast_fillna(cmo, method=kwargs["fill_method"])
+
+    # Name and Categorize it
+    cmo.name = f"CMO_{length}"
+    cmo.category = "momentum"
+
+    return cmo
+
+
+cmo_batch.__doc__ = \
+"""Chande Momentum Oscillator (CMO) Batch
+
+Calculates the Wilder smoothed CMO for every column of a DataFrame of 'close's,
+for instance one column per symbol. The columns are computed in parallel
+threads when numba is installed. Each column equals what
+cmo(close[column], length, scalar, drift=drift) returns when TA Lib is not
+installed. It differs from TA Lib's CMO and from the rolling sum version,
+cmo(..., talib=False).
+
+Args:
+    close (pd.DataFrame): DataFrame of 'close's, one column per series
+    length (int): It's period. Default: 14
+    scalar (float): How much to magnify. Default: 100
+    drift (int): The short period. Default: 1
+    offset (int): How many periods to offset the result. Default: 0
+
+Kwargs:
+    fillna (value, optional): pd.DataFrame.fillna(value)
+    fill_method (value, optional): Type of fill method
+
+Returns:
+    pd.DataFrame: CMO for each column.
+"""
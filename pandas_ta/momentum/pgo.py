@@ -1,10 +1,88 @@
 # -*- coding: utf-8 -*-
+from sys import float_info as sflt
+
+from numpy import ascontiguousarray as npAscontiguousarray
+from numpy import empty_like as npEmptyLike
+from numpy import float64 as npFloat64
+from numpy import full as npFull
+from numpy import nan as npNaN
+from pandas import DataFrame, Series
+from pandas_ta import Imports
 from pandas_ta.overlap import ema, sma
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_offset, verify_series
-
-
-def pgo(high, low, close, length=None, offset=None, **kwargs):
+from pandas_ta.utils import fast_fillna, fast_shift, get_offset, njit, numba_kernel, prange, ro_float64_1d, verify_series
+
+_EPSILON = sflt.epsilon
+
+
+@njit(f"float64[:]({ro_float64_1d}, {ro_float64_1d}, {ro_float64_1d}, int64)", cache=True)
+def _pgo_loop(high, low, close, length):
+    """PGO in a single pass. Tracks a rolling sum for the SMA, an rma()
+    smoothed True Range for the ATR and an ema() of that ATR, matching the
+    Python versions of sma(), atr() and ema(), NaNs included: windows with a
+    NaN close have no SMA, and NaN True Ranges only decay the rma weight."""
+    m = close.size
+    result = npFull(m, npNaN)
+    inv_n = 1.0 / length
+    decay = 1.0 - inv_n
+    alpha = 2.0 / (length + 1)
+    one_ma = 1.0 - alpha
+
+    # Same as non_zero_range(high, low)
+    high_low_range = high - low
+    if (high_low_range == 0).any():
+        high_low_range = high_low_range + _EPSILON
+
+    sma_sum = atr_ = weight = ema_ = 0.0
+    sma_nans = tr_nobs = 0
+    for i in range(m):
+        if close[i] == close[i]:
+            sma_sum += close[i]
+        else:
+            sma_nans += 1
+        if i >= length:
+            if close[i - length] == close[i - length]:
+                sma_sum -= close[i - length]
+            else:
+                sma_nans -= 1
+        if i == 0:
+            continue
+
+        # Largest of the non NaN ranges, like true_range()
+        prev_close = close[i - 1]
+        tr = npNaN
+        for r in (abs(high_low_range[i]), abs(high[i] - prev_close), abs(prev_close - low[i])):
+            if r > tr or tr != tr:
+                tr = r
+
+        if tr == tr:
+            if tr_nobs == 0:
+                atr_, weight = tr, 1.0
+            else:
+                weight *= decay
+                atr_ = (weight * atr_ + tr) / (weight + 1)
+                weight += 1
+            tr_nobs += 1
+        elif tr_nobs > 0:
+            weight *= decay
+
+        if tr_nobs >= length:
+            ema_ = atr_ if tr_nobs == length and tr == tr else one_ma * ema_ + alpha * atr_
+            if sma_nans == 0:
+                result[i] = (close[i] - sma_sum * inv_n) / ema_
+    return result
+
+
+@njit(parallel=True, cache=True)
+def _pgo_batch(high, low, close, length):
+    """PGO for each row of 2D arrays, rows computed in parallel"""
+    result = npEmptyLike(close)
+    for s in prange(close.shape[0]):
+        result[s] = _pgo_loop(high[s], low[s], close[s], length)
+    return result
+
+
+def pgo(high, low, close, length=None, offset=None, talib=None, engine=None, engine_kwargs=None, **kwargs):
     """Indicator: Pretty Good Oscillator (PGO)"""
     # Validate arguments
     length = int(length) if length and length > 0 else 14
@@ -12,22 +90,33 @@ def pgo(high, low, close, length=None, offset=None, **kwargs):
     low = verify_series(low, length)
     close = verify_series(close, length)
     offset = get_offset(offset)
+    mode_tal = bool(talib) if isinstance(talib, bool) else True
+    mode_numba = Imports["numba"] and isinstance(engine, str) and engine.lower() == "numba"
 
     if high is None or low is None or close is None: return
 
     # Calculate Result
-    pgo = close - sma(close, length)
-    pgo /= ema(atr(high, low, close, length), length)
+    if Imports["talib"] and mode_tal and not mode_numba:
+        pgo = close - sma(close, length)
+        pgo /= ema(atr(high, low, close, length), length)
+    else:
+        pgo = numba_kernel(_pgo_loop, engine_kwargs)(
+            high.to_numpy(dtype=npFloat64),
+            low.to_numpy(dtype=npFloat64),
+            close.to_numpy(dtype=npFloat64),
+            length
+        )
+        pgo = Series(pgo, index=close.index)
 
     # Offset
     if offset != 0:
-        pgo = pgo.shift(offset)
+        pgo = fast_shift(pgo, offset)
 
     # Handle fills
     if "fillna" in kwargs:
-        pgo.fillna(kwargs["fillna"], inplace=True)
+        pgo = fast_fillna(pgo, kwargs["fillna"])
     if "fill_method" in kwargs:
-        pgo.fillna(method=kwargs["fill_method"], inplace=True)
+        pgo = fast_fillna(pgo, method=kwargs["fill_method"])
 
     # Name and Categorize it
     pgo.name = f"PGO_{length}"
@@ -61,6 +150,12 @@ Args:
     close (pd.Series): Series of 'close's
     length (int): It's period. Default: 14
     offset (int): How many periods to offset the result. Default: 0
+    talib (bool): If TA Lib is installed and talib is True, uses TA Lib's
+        SMA, ATR and EMA. Default: True
+    engine (str): If 'numba' and numba is installed, uses the njit kernel
+        even if TA Lib is installed. Default: None
+    engine_kwargs (dict): Options passed to numba.njit for the kernel, e.g.
+        {"parallel": True, "nogil": True}. Default: None
 
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
@@ -69,3 +164,58 @@ Kwargs:
 Returns:
     pd.Series: New feature generated.
 """
+
+
+def pgo_batch(high, low, close, length=None, offset=None, **kwargs):
+    """Indicator: Pretty Good Oscillator (PGO) for each column"""
+    # Validate arguments
+    length = int(length) if length and length > 0 else 14
+    offset = get_offset(offset)
+
+    if not all(isinstance(x, DataFrame) for x in [high, low, close]): return
+    if not high.shape == low.shape == close.shape or close.shape[0] < length: return
+
+    # Calculate Result
+    high_, low_, close_ = [npAscontiguousarray(x.to_numpy(dtype=npFloat64).T) for x in [high, low, close]]
+    pgo = _pgo_batch(high_, low_, close_, length)
+    pgo = DataFrame(pgo.T, index=close.index, columns=close.columns)
+
+    # Offset
+    if offset != 0:
+        pgo = pgo.shift(offset)
+
+    # Handle fills
+    if "fillna" in kwargs:
+        pgo = fast_fillna(pgo, kwargs["fillna"])
+    if "fill_method" in kwargs:
+        pgo = fast_fillna(pgo, method=kwargs["fill_method"])
+
+    # Name and Categorize it
+    pgo.name = f"PGO_{length}"
+    pgo.category = "momentum"
+
+    return pgo
+
+
+pgo_batch.__doc__ = \
+"""Pretty Good Oscillator (PGO) Batch
+
+Calculates PGO for every column of DataFrames of 'high's, 'low's and 'close's,
+for instance one column per symbol. The columns are computed in parallel
+threads when numba is installed. Each column equals
+pgo(high[column], low[column], close[column], length, talib=False).
+
+Args:
+    high (pd.DataFrame): DataFrame of 'high's, one column per series
+    low (pd.DataFrame): DataFrame of 'low's, one column per series
+    close (pd.DataFrame): DataFrame of 'close's, one column per series
+    length (int): It's period. Default: 14
+    offset (int): How many periods to offset the result. Default: 0
+
+Kwargs:
+    fillna (value, optional): pd.DataFrame.fillna(value)
+    fill_method (value, optional): Type of fill method
+
+Returns:
+    pd.DataFrame: PGO for each column.
+"""
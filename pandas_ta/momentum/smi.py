@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
+from numpy import column_stack as npColumnStack
+from numpy import nan as npNaN
+from numpy import roll as npRoll
 from pandas import DataFrame
 from .tsi import tsi
 from pandas_ta.overlap import ema
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fast_fillna, get_offset, verify_series
 
 
 def smi(close, fast=None, slow=None, signal=None, scalar=None, offset=None, **kwargs):
@@ -21,39 +24,34 @@ def smi(close, fast=None, slow=None, signal=None, scalar=None, offset=None, **kw
 
     # Calculate Result
     tsi_df = tsi(close, fast=fast, slow=slow, signal=signal, scalar=scalar)
-    smi = tsi_df.iloc[:, 0]
-    signalma = tsi_df.iloc[:, 1]
-    osc = smi - signalma
+    values = tsi_df.to_numpy()
+    smi, signalma = values[:, 0], values[:, 1]
+    result = npColumnStack((smi, signalma, smi - signalma))
 
     # Offset
     if offset != 0:
-        smi = smi.shift(offset)
-        signalma = signalma.shift(offset)
-        osc = osc.shift(offset)
-
-    # Handle fills
-    if "fillna" in kwargs:
-        smi.fillna(kwargs["fillna"], inplace=True)
-        signalma.fillna(kwargs["fillna"], inplace=True)
-        osc.fillna(kwargs["fillna"], inplace=True)
-    if "fill_method" in kwargs:
-        smi.fillna(method=kwargs["fill_method"], inplace=True)
-        signalma.fillna(method=kwargs["fill_method"], inplace=True)
-        osc.fillna(method=kwargs["fill_method"], inplace=True)
+        result = npRoll(result, offset, axis=0)
+        if offset > 0:
+            result[:offset] = npNaN
+        else:
+            result[offset:] = npNaN
 
     # Name and Categorize it
     _scalar = f"_{scalar}" if scalar != 1 else ""
     _props = f"_{fast}_{slow}_{signal}{_scalar}"
-    smi.name = f"SMI{_props}"
-    signalma.name = f"SMIs{_props}"
-    osc.name = f"SMIo{_props}"
-    smi.category = signalma.category = osc.category = "momentum"
 
     # Prepare DataFrame to return
-    data = {smi.name: smi, signalma.name: signalma, osc.name: osc}
-    df = DataFrame(data)
+    columns = [f"SMI{_props}", f"SMIs{_props}", f"SMIo{_props}"]
+    df = DataFrame(result, index=close.index, columns=columns)
+
+    # Handle fills
+    if "fillna" in kwargs:
+        df = fast_fillna(df, kwargs["fillna"])
+    if "fill_method" in kwargs:
+        df = fast_fillna(df, method=kwargs["fill_method"])
+
     df.name = f"SMI{_props}"
-    df.category = smi.category
+    df.category = "momentum"
 
     return df
 
@@ -24,10 +24,10 @@ from .sma import sma
 from .ssf import ssf
 from .supertrend import supertrend
 from .swma import swma
-from .t3 import t3
+from .t3 import t3, t3_batch
 from .tema import tema
 from .trima import trima
-from .vidya import vidya
+from .vidya import vidya, vidya_batch
 from .vwap import vwap
 from .vwma import vwma
 from .wcp import wcp
@@ -1,30 +1,64 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import fibonacci, get_offset, verify_series, weights
-
-
-def fwma(close, length=None, asc=None, offset=None, **kwargs):
+from functools import lru_cache
+
+from numpy import float64 as npFloat64
+from numpy import full as npFull
+from numpy import nan as npNaN
+from pandas import Series
+from pandas_ta import Imports
+from pandas_ta.utils import fast_fillna, fast_shift, fibonacci, get_offset, njit, numba_kernel, prange
+from pandas_ta.utils import sliding_weighted_ma, verify_series
+
+
+@lru_cache(maxsize=256)
+def _fwma_weights(length: int):
+    """Read-only Fibonacci weights cached per length"""
+    fibs = fibonacci(n=length, weighted=True).astype(npFloat64)
+    fibs.setflags(write=False)
+    return fibs
+
+
+@njit(cache=True)
+def _fwma_loop(close, w):
+    """Dot product of the weights w with each window of close"""
+    m, n = close.size, w.size
+    result = npFull(m, npNaN)
+    for i in prange(n - 1, m):
+        total = 0.0
+        for j in range(n):
+            total += w[j] * close[i - n + 1 + j]
+        result[i] = total
+    return result
+
+
+def fwma(close, length=None, asc=None, offset=None, engine=None, engine_kwargs=None, **kwargs):
     """Indicator: Fibonacci's Weighted Moving Average (FWMA)"""
     # Validate Arguments
     length = int(length) if length and length > 0 else 10
     asc = asc if asc else True
     close = verify_series(close, length)
     offset = get_offset(offset)
+    mode_numba = Imports["numba"] and isinstance(engine, str) and engine.lower() == "numba"
 
     if close is None: return
 
     # Calculate Result
-    fibs = fibonacci(n=length, weighted=True)
-    fwma = close.rolling(length, min_periods=length).apply(weights(fibs), raw=True)
+    fibs = _fwma_weights(length)
+    if mode_numba:
+        fwma = numba_kernel(_fwma_loop, engine_kwargs)(close.to_numpy(dtype=npFloat64), fibs)
+        fwma = Series(fwma, index=close.index)
+    else:
+        fwma = sliding_weighted_ma(close, fibs)
 
     # Offset
     if offset != 0:
-        fwma = fwma.shift(offset)
+        fwma = fast_shift(fwma, offset)
 
     # Handle fills
     if "fillna" in kwargs:
-        fwma.fillna(kwargs["fillna"], inplace=True)
+        fwma = fast_fillna(fwma, kwargs["fillna"])
     if "fill_method" in kwargs:
-        fwma.fillna(method=kwargs["fill_method"], inplace=True)
+        fwma = fast_fillna(fwma, method=kwargs["fill_method"])
 
     # Name & Category
     fwma.name = f"FWMA_{length}"
@@ -58,6 +92,10 @@ Args:
     length (int): It's period. Default: 10
     asc (bool): Recent values weigh more. Default: True
     offset (int): How many periods to offset the result. Default: 0
+    engine (str): If 'numba' and numba is installed, uses the njit kernel.
+        Default: None
+    engine_kwargs (dict): Options passed to numba.njit for the kernel, e.g.
+        {"parallel": True, "nogil": True}. Default: None
 
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
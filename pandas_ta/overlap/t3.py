@@ -1,7 +1,73 @@
 # -*- coding: utf-8 -*-
+from functools import lru_cache
+
+from numpy import ascontiguousarray as npAscontiguousarray
+from numpy import empty_like as npEmptyLike
+from numpy import float32 as npFloat32
+from numpy import float64 as npFloat64
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from pandas import DataFrame, Series
 from .ema import ema
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import fast_fillna, fast_shift, get_offset, njit, prange, ro_float32_1d, ro_float64_1d, verify_series
+
+
+@lru_cache(maxsize=256)
+def _t3_coefficients(a: float):
+    """T3 coefficients c1, c2, c3, c4 for the volume factor a"""
+    a2 = a * a
+    a3 = a2 * a
+    c1 = -a3
+    c2 = 3 * (a2 + a3)
+    c3 = -3 * (2 * a2 + a + a3)
+    c4 = a3 + 3 * a2 + 3 * a + 1
+    return c1, c2, c3, c4
+
+
+@njit([
+    f"float64[:]({ro_float64_1d}, int64, float64, float64, float64, float64, float64)",
+    f"float32[:]({ro_float32_1d}, int64, float32, float32, float32, float32, float32)"
+], cache=True)
+def _t3_loop(close, length, alpha, c1, c2, c3, c4):
+    """Six chained SMA seeded EMAs in a single pass. Each EMA is seeded at
+    'length - 1' with the SMA of the first 'length' closes. The arithmetic
+    runs in the dtype of close, alpha and the coefficients."""
+    m = close.size
+    result = npEmptyLike(close)
+    result[:length - 1] = npNaN
+
+    e1 = e2 = e3 = e4 = e5 = e6 = close[:length].mean()
+    result[length - 1] = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+    for i in range(length, m):
+        e1 += alpha * (close[i] - e1)
+        e2 += alpha * (e1 - e2)
+        e3 += alpha * (e2 - e3)
+        e4 += alpha * (e3 - e4)
+        e5 += alpha * (e4 - e5)
+        e6 += alpha * (e5 - e6)
+        result[i] = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+    return result
+
+
+@njit(parallel=True, cache=True)
+def _t3_batch(close, length, alpha, c1, c2, c3, c4):
+    """T3 for each row of a 2D array, rows computed in parallel"""
+    result = npEmptyLike(close)
+    for s in prange(close.shape[0]):
+        result[s] = _t3_loop(close[s], length, alpha, c1, c2, c3, c4)
+    return result
+
+
+def _t3_ema(close, length, c1, c2, c3, c4, **kwargs):
+    """T3 from six chained Python ema() calls"""
+    e1 = ema(close=close, length=length, talib=False, **kwargs)
+    e2 = ema(close=e1, length=length, talib=False, **kwargs)
+    e3 = ema(close=e2, length=length, talib=False, **kwargs)
+    e4 = ema(close=e3, length=length, talib=False, **kwargs)
+    e5 = ema(close=e4, length=length, talib=False, **kwargs)
+    e6 = ema(close=e5, length=length, talib=False, **kwargs)
+    return c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
 
 
 def t3(close, length=None, a=None, talib=None, offset=None, **kwargs):
@@ -20,28 +86,30 @@ def t3(close, length=None, a=None, talib=None, offset=None, **kwargs):
         from talib import T3
         t3 = T3(close, length, a)
     else:
-        c1 = -a * a**2
-        c2 = 3 * a**2 + 3 * a**3
-        c3 = -6 * a**2 - 3 * a - 3 * a**3
-        c4 = a**3 + 3 * a**2 + 3 * a + 1
-
-        e1 = ema(close=close, length=length, **kwargs)
-        e2 = ema(close=e1, length=length, **kwargs)
-        e3 = ema(close=e2, length=length, **kwargs)
-        e4 = ema(close=e3, length=length, **kwargs)
-        e5 = ema(close=e4, length=length, **kwargs)
-        e6 = ema(close=e5, length=length, **kwargs)
-        t3 = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+        c1, c2, c3, c4 = _t3_coefficients(a)
+
+        dtype = npFloat32 if kwargs.get("dtype") in ["float32", npFloat32] else npFloat64
+        values = close.to_numpy(dtype=dtype)
+
+        # The kernel has no NaN handling, ewm() does
+        if not kwargs.get("adjust", False) and kwargs.get("sma", True) and not npIsnan(values).any():
+            t3 = _t3_loop(
+                values, length, dtype(2 / (length + 1)),
+                dtype(c1), dtype(c2), dtype(c3), dtype(c4)
+            )
+            t3 = Series(t3.astype(npFloat64), index=close.index)
+        else:
+            t3 = _t3_ema(close, length, c1, c2, c3, c4, **kwargs)
 
     # Offset
     if offset != 0:
-        t3 = t3.shift(offset)
+        t3 = fast_shift(t3, offset)
 
     # Handle fills
     if "fillna" in kwargs:
-        t3.fillna(kwargs["fillna"], inplace=True)
+        t3 = fast_fillna(t3, kwargs["fillna"])
     if "fill_method" in kwargs:
-        t3.fillna(method=kwargs["fill_method"], inplace=True)
+        t3 = fast_fillna(t3, method=kwargs["fill_method"])
 
     # Name & Category
     t3.name = f"T3_{length}_{a}"
@@ -85,9 +153,71 @@ Args:
 Kwargs:
     adjust (bool): Default: True
     presma (bool, optional): If True, uses SMA for initial value.
+    dtype (str, optional): If "float32", the six chained EMAs of the Python
+        version run in single precision, which compounds to a relative
+        error of about 2e-6. Ignored when close contains NaNs, those run
+        through the ema() chain. Default: "float64"
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
 Returns:
     pd.Series: New feature generated.
 """
+
+
+def t3_batch(close, length=None, a=None, offset=None, **kwargs):
+    """Indicator: T3 for each column"""
+    # Validate Arguments
+    length = int(length) if length and length > 0 else 10
+    a = float(a) if a and a > 0 and a < 1 else 0.7
+    offset = get_offset(offset)
+
+    if not isinstance(close, DataFrame) or close.shape[0] < length: return
+
+    # Calculate Result
+    c1, c2, c3, c4 = _t3_coefficients(a)
+    values = npAscontiguousarray(close.to_numpy(dtype=npFloat64).T)
+    t3 = _t3_batch(values, length, 2 / (length + 1), c1, c2, c3, c4)
+    t3 = DataFrame(t3.T, index=close.index, columns=close.columns)
+
+    # The kernel has no NaN handling, see t3()
+    for column in close.columns[close.isna().any().to_numpy()]:
+        t3[column] = _t3_ema(close[column], length, c1, c2, c3, c4)
+
+    # Offset
+    if offset != 0:
+        t3 = t3.shift(offset)
+
+    # Handle fills
+    if "fillna" in kwargs:
+        t3 = fast_fillna(t3, kwargs["fillna"])
+    if "fill_method" in kwargs:
+        t3 = fast_fillna(t3, method=kwargs["fill_method"])
+
+    # Name & Category
+    t3.name = f"T3_{length}_{a}"
+    t3.category = "overlap"
+
+    return t3
+
+
+t3_batch.__doc__ = \
+"""Tim Tillson's T3 Moving Average (T3) Batch
+
+Calculates T3 for every column of a DataFrame of 'close's, for instance one
+column per symbol. The columns are computed in parallel threads when numba is
+installed. Each column equals t3(close[column], length, a, talib=False).
+
+Args:
+    close (pd.DataFrame): DataFrame of 'close's, one column per series
+    length (int): It's period. Default: 10
+    a (float): 0 < a < 1. Default: 0.7
+    offset (int): How many periods to offset the result. Default: 0
+
+Kwargs:
+    fillna (value, optional): pd.DataFrame.fillna(value)
+    fill_method (value, optional): Type of fill method
+
+Returns:
+    pd.DataFrame: T3 for each column.
+"""
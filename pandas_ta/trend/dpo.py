@@ -1,14 +1,50 @@
 # -*- coding: utf-8 -*-
+from numpy import float64 as npFloat64
+from numpy import full as npFull
+from numpy import nan as npNaN
+from pandas import Series
+from pandas_ta import Imports
 from pandas_ta.overlap import sma
-from pandas_ta.utils import get_offset, verify_series
-
-
-def dpo(close, length=None, centered=True, offset=None, **kwargs):
+from pandas_ta.utils import fast_fillna, fast_shift, get_offset, njit, numba_kernel, verify_series
+
+
+@njit(cache=True)
+def _dpo_loop(close, length, t, centered):
+    """DPO with the SMA maintained as a rolling sum in a single pass. Like
+    sma(), windows containing a NaN have no SMA."""
+    m = close.size
+    result = npFull(m, npNaN)
+    inv_n = 1.0 / length
+
+    ma_sum = 0.0
+    nans = 0
+    for i in range(m):
+        if close[i] == close[i]:
+            ma_sum += close[i]
+        else:
+            nans += 1
+        if i >= length:
+            if close[i - length] == close[i - length]:
+                ma_sum -= close[i - length]
+            else:
+                nans -= 1
+        if i >= length - 1:
+            ma = ma_sum * inv_n if nans == 0 else npNaN
+            if centered:
+                if i >= t:
+                    result[i - t] = close[i - t] - ma
+            elif i + t < m:
+                result[i + t] = close[i + t] - ma
+    return result
+
+
+def dpo(close, length=None, centered=True, offset=None, engine=None, engine_kwargs=None, **kwargs):
     """Indicator: Detrend Price Oscillator (DPO)"""
     # Validate Arguments
     length = int(length) if length and length > 0 else 20
     close = verify_series(close, length)
     offset = get_offset(offset)
+    mode_numba = Imports["numba"] and isinstance(engine, str) and engine.lower() == "numba"
     if not kwargs.get("lookahead", True):
         centered = False
 
@@ -16,21 +52,32 @@ def dpo(close, length=None, centered=True, offset=None, **kwargs):
 
     # Calculate Result
     t = int(0.5 * length) + 1
-    ma = sma(close, length)
-
-    dpo = close - ma.shift(t)
-    if centered:
-        dpo = (close.shift(t) - ma).shift(-t)
+    values = close.to_numpy(dtype=npFloat64)
+    if mode_numba:
+        dpo = numba_kernel(_dpo_loop, engine_kwargs)(values, length, t, bool(centered))
+    else:
+        if Imports["bottleneck"]:
+            from bottleneck import move_mean
+            ma = move_mean(values, length, min_count=length)
+        else:
+            ma = sma(close, length, talib=False).to_numpy(dtype=npFloat64)
+
+        dpo = npFull(values.size, npNaN)
+        if centered:
+            dpo[:-t] = values[:-t] - ma[t:]
+        else:
+            dpo[t:] = values[t:] - ma[:-t]
+    dpo = Series(dpo, index=close.index)
 
     # Offset
     if offset != 0:
-        dpo = dpo.shift(offset)
+        dpo = fast_shift(dpo, offset)
 
     # Handle fills
     if "fillna" in kwargs:
-        dpo.fillna(kwargs["fillna"], inplace=True)
+        dpo = fast_fillna(dpo, kwargs["fillna"])
     if "fill_method" in kwargs:
-        dpo.fillna(method=kwargs["fill_method"], inplace=True)
+        dpo = fast_fillna(dpo, method=kwargs["fill_method"])
 
     # Name and Categorize it
     dpo.name = f"DPO_{length}"
@@ -65,6 +112,10 @@ Args:
     length (int): It's period. Default: 1
     centered (bool): Shift the dpo back by int(0.5 * length) + 1. Default: True
     offset (int): How many periods to offset the result. Default: 0
+    engine (str): If 'numba' and numba is installed, uses the njit kernel.
+        Default: None
+    engine_kwargs (dict): Options passed to numba.njit for the kernel, e.g.
+        {"parallel": True, "nogil": True}. Default: None
 
 Kwargs:
     fillna (value, optional): pd.DataFrame.fillna(value)
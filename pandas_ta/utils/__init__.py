@@ -2,6 +2,7 @@
 from ._candles import *
 from ._core import *
 from ._math import *
+from ._njit import *
 from ._signals import *
 from ._time import *
 from ._metrics import *
@@ -3,7 +3,14 @@ import re as re_
 from pathlib import Path
 from sys import float_info as sflt
 
+from numbers import Number
+
 from numpy import argmax, argmin
+from numpy import copyto as npCopyto
+from numpy import empty as npEmpty
+from numpy import float64 as npFloat64
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
 from pandas import DataFrame, Series
 from pandas.api.types import is_datetime64_any_dtype
 from pandas_ta import Imports
@@ -24,6 +31,55 @@ def category_files(category: str) -> list:
     return files
 
 
+def fast_shift(series: Series, periods: int) -> Series:
+    """Returns series.shift(periods) for numeric Series by shifting the
+    underlying array and wrapping it with the same index and name."""
+    values = series.to_numpy()
+    dtype = values.dtype if values.dtype.kind == "f" else npFloat64
+    result, m = npEmpty(values.size, dtype=dtype), values.size
+
+    if abs(periods) >= m:
+        result[:] = npNaN
+    elif periods >= 0:
+        result[:periods] = npNaN
+        result[periods:] = values[:m - periods]
+    else:
+        result[periods:] = npNaN
+        result[:periods] = values[-periods:]
+    return Series(result, index=series.index, name=series.name)
+
+
+def fast_fillna(x, value=None, method=None):
+    """Returns x.fillna(value) or x.fillna(method=method) for a Series or
+    DataFrame of floats by filling the underlying array with a single masked
+    copy. Forward and backward fills use bottleneck.push when installed.
+    Anything else is left to pandas."""
+    values = x.to_numpy()
+    forward = method in ["ffill", "pad"]
+    backward = method in ["bfill", "backfill"]
+
+    fast_value = value is not None and method is None and isinstance(value, Number)
+    fast_method = value is None and (forward or backward) and Imports["bottleneck"]
+    if values.dtype.kind != "f" or not (fast_value or fast_method):
+        return x.fillna(value, method=method)
+
+    copied = isinstance(x, DataFrame) or not values.flags.writeable
+    if copied:
+        values = values.copy()
+    if fast_value:
+        npCopyto(values, value, where=npIsnan(values))
+    else:
+        from bottleneck import push
+        view = values if forward else values[::-1]
+        view[...] = push(view, axis=0)
+
+    if isinstance(x, DataFrame):
+        return DataFrame(values, index=x.index, columns=x.columns)
+    if copied:
+        return Series(values, index=x.index, name=x.name)
+    return x
+
+
 def get_drift(x: int) -> int:
     """Returns an int if not zero, otherwise defaults to one."""
     return int(x) if isinstance(x, int) and x != 0 else 1
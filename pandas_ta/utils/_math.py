@@ -9,9 +9,13 @@ from numpy import ones, triu
 from numpy import all as npAll
 from numpy import append as npAppend
 from numpy import array as npArray
+from numpy import asarray as npAsarray
+from numpy import concatenate as npConcatenate
 from numpy import corrcoef as npCorrcoef
 from numpy import dot as npDot
 from numpy import fabs as npFabs
+from numpy import float64 as npFloat64
+from numpy import full as npFull
 from numpy import exp as npExp
 from numpy import log as npLog
 from numpy import nan as npNaN
@@ -19,6 +23,7 @@ from numpy import ndarray as npNdArray
 from numpy import seterr
 from numpy import sqrt as npSqrt
 from numpy import sum as npSum
+from numpy.lib.stride_tricks import sliding_window_view
 
 from pandas import DataFrame, Series
 
@@ -163,6 +168,17 @@ def pascals_triangle(n: int = None, **kwargs: dict) -> npNdArray:
     return triangle
 
 
+def sliding_weighted_ma(series: Series, w: npNdArray) -> Series:
+    """Weighted Moving Average of a Series with the weights w. Equivalent to
+    series.rolling(len(w)).apply(weights(w), raw=True) but computed as a single
+    matrix-vector product over the sliding windows of the underlying array."""
+    w = npAsarray(w, dtype=npFloat64)
+    length = w.size
+    values = series.to_numpy(dtype=npFloat64)
+    wma = sliding_window_view(values, length) @ w
+    return Series(npConcatenate((npFull(length - 1, npNaN), wma)), index=series.index)
+
+
 def symmetric_triangle(n: int = None, **kwargs: dict) -> Optional[List[int]]:
     """Symmetric Triangle with n >= 2
 
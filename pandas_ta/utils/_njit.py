@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+from pandas_ta import Imports
+
+
+if Imports["numba"]:
+    from numba import njit, prange
+else:
+    def njit(*args, **kwargs):
+        """Fallback for numba's njit when numba is not installed. Returns the
+        decorated function unchanged so kernels run as plain Python loops."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def _decorator(func):
+            return func
+        return _decorator
+
+    prange = range
+
+# Array types for explicit njit signatures. Readonly so both writable arrays
+# and readonly views of pandas data match them.
+ro_float32_1d = "Array(float32, 1, 'A', readonly=True)"
+ro_float64_1d = "Array(float64, 1, 'A', readonly=True)"
+
+
+_numba_kernels = {}
+
+
+def numba_kernel(kernel, engine_kwargs: dict = None):
+    """Returns the njit kernel recompiled with numba.njit(**engine_kwargs),
+    e.g. {"parallel": True, "nogil": True}. Compiled kernels are cached per
+    kernel and engine_kwargs. Without engine_kwargs, returns the kernel."""
+    if not engine_kwargs or not Imports["numba"]:
+        return kernel
+
+    key = (kernel.py_func, tuple(sorted(engine_kwargs.items())))
+    if key not in _numba_kernels:
+        _numba_kernels[key] = njit(**engine_kwargs)(kernel.py_func)
+    return _numba_kernels[key]
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.momentum import roc
-from pandas_ta.utils import get_offset, signed_series, verify_series
+from numpy import errstate as npErrstate
+from numpy import float64 as npFloat64
+from numpy import isnan as npIsnan
+from numpy import where as npWhere
+from numpy import zeros as npZeros
+from pandas import Series
+from pandas_ta.utils import fast_fillna, fast_shift, get_offset, verify_series
 
 
 def pvi(close, volume, length=None, initial=None, offset=None, **kwargs):
@@ -16,21 +21,27 @@ def pvi(close, volume, length=None, initial=None, offset=None, **kwargs):
     if close is None or volume is None: return
 
     # Calculate Result
-    signed_volume = signed_series(volume, 1)
-    pvi = roc(close=close, length=length) * signed_volume[signed_volume > 0].abs()
-    pvi.fillna(0, inplace=True)
-    pvi.iloc[0] = initial
-    pvi = pvi.cumsum()
+    values = close.to_numpy(dtype=npFloat64)
+    vol = volume.to_numpy(dtype=npFloat64)
+
+    with npErrstate(divide="ignore", invalid="ignore"):
+        roc_ = 100 * (values[length:] - values[:-length]) / values[:-length]
+    increased = vol[length:] > vol[length - 1:-1]
+
+    pvi = npZeros(values.size)
+    pvi[length:] = npWhere(increased & ~npIsnan(roc_), roc_, 0)
+    pvi[0] = initial
+    pvi = Series(pvi.cumsum(), index=close.index)
 
     # Offset
     if offset != 0:
-        pvi = pvi.shift(offset)
+        pvi = fast_shift(pvi, offset)
 
     # Handle fills
     if "fillna" in kwargs:
-        pvi.fillna(kwargs["fillna"], inplace=True)
+        pvi = fast_fillna(pvi, kwargs["fillna"])
     if "fill_method" in kwargs:
-        pvi.fillna(method=kwargs["fill_method"], inplace=True)
+        pvi = fast_fillna(pvi, method=kwargs["fill_method"])
 
     # Name and Categorize it
     pvi.name = f"PVI_{length}"
@@ -56,7 +56,7 @@ setup(
     # $ pip install -e .[dev,test]
     extras_require={
         "dev": [
-            "alphaVantage-api", "matplotlib", "mplfinance", "scipy",
+            "alphaVantage-api", "bottleneck", "matplotlib", "mplfinance", "scipy",
             "sklearn", "statsmodels", "stochastic",
             "talib", "tqdm", "vectorbt", "yfinance",
         ],
@@ -2,6 +2,7 @@ from .config import error_analysis, sample_data, CORRELATION, CORRELATION_THRESH
 from .context import pandas_ta
 
 from unittest import TestCase, skip
+from unittest.mock import patch
 import pandas.testing as pdt
 from pandas import DataFrame, Series
 
@@ -160,6 +161,43 @@ class TestMomentum(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "CMO_14")
 
+    def test_cmo_drift(self):
+        # Wilder smoothed version, as used when TA Lib is missing
+        for drift in [2, -1]:
+            mom = self.close.diff(drift)
+            positive = pandas_ta.rma(mom.clip(lower=0), 14)
+            negative = pandas_ta.rma(mom.clip(upper=0).abs(), 14)
+            expected = 100 * (positive - negative) / (positive + negative)
+            with patch.dict(pandas_ta.Imports, {"talib": False}):
+                result = pandas_ta.cmo(self.close, drift=drift)
+            pdt.assert_series_equal(result, expected, check_names=False)
+
+    def test_cmo_rolling_drift(self):
+        for drift in [2, -1, -3]:
+            mom = self.close.diff(drift)
+            positive = mom.clip(lower=0).rolling(14).sum()
+            negative = mom.clip(upper=0).abs().rolling(14).sum()
+            expected = 100 * (positive - negative) / (positive + negative)
+            result = pandas_ta.cmo(self.close, drift=drift, talib=False)
+            pdt.assert_series_equal(result, expected, check_names=False)
+
+    def test_cmo_batch(self):
+        closes = DataFrame({"a": self.close, "b": 2 * self.close})
+        result = pandas_ta.cmo_batch(closes)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "CMO_14")
+        self.assertListEqual(list(result.columns), ["a", "b"])
+
+        # The batch is the Wilder smoothed cmo() used when TA Lib is missing
+        with patch.dict(pandas_ta.Imports, {"talib": False}):
+            expected = pandas_ta.cmo(closes["b"])
+            expected_drift = pandas_ta.cmo(closes["b"], drift=-1)
+        pdt.assert_series_equal(result["b"], expected, check_names=False)
+
+        result = pandas_ta.cmo_batch(closes, drift=-1)
+        pdt.assert_series_equal(result["b"], expected_drift, check_names=False)
+        self.assertIsNone(pandas_ta.cmo_batch(closes.iloc[:10]))
+
     def test_coppock(self):
         result = pandas_ta.coppock(self.close)
         self.assertIsInstance(result, Series)
@@ -296,6 +334,51 @@ class TestMomentum(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "PGO_14")
 
+    def test_pgo_engine(self):
+        # The positional offset keeps its place ahead of the new arguments
+        result = pandas_ta.pgo(self.high, self.low, self.close, 14, 3)
+        pdt.assert_series_equal(result, pandas_ta.pgo(self.high, self.low, self.close, 14, offset=3))
+
+        high, low, close = self.high.copy(), self.low.copy(), self.close.copy()
+        for nans in [[], [5, 300, 301, 2000]]:
+            high.iloc[nans[:1]] = None
+            close.iloc[nans] = None
+            expected = pandas_ta.pgo(high, low, close, talib=False)
+            result = pandas_ta.pgo(high, low, close, engine="numba")
+            pdt.assert_series_equal(result, expected)
+
+            result = pandas_ta.pgo(high, low, close, engine="numba", engine_kwargs={"nogil": True})
+            pdt.assert_series_equal(result, expected)
+
+    def test_pgo_nan(self):
+        high, low, close = self.high.copy(), self.low.copy(), self.close.copy()
+        high.iloc[300] = None
+        low.iloc[[3, 700]] = None
+        close.iloc[[50, 51, 900]] = None
+
+        # Python versions only, including the true_range() inside atr()
+        with patch.dict(pandas_ta.Imports, {"talib": False}):
+            result = pandas_ta.pgo(high, low, close, talib=False)
+            expected = close - pandas_ta.sma(close, 14, talib=False)
+            expected /= pandas_ta.ema(pandas_ta.atr(high, low, close, 14, talib=False), 14, talib=False)
+
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "PGO_14")
+        pdt.assert_series_equal(result, expected, check_names=False)
+        self.assertEqual(result.isna().sum(), expected.isna().sum())
+
+    def test_pgo_batch(self):
+        highs = DataFrame({"a": self.high, "b": 2 * self.high})
+        lows = DataFrame({"a": self.low, "b": 2 * self.low})
+        closes = DataFrame({"a": self.close, "b": 2 * self.close})
+        result = pandas_ta.pgo_batch(highs, lows, closes)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "PGO_14")
+        expected = pandas_ta.pgo(highs["b"], lows["b"], closes["b"], talib=False)
+        pdt.assert_series_equal(result["b"], expected, check_names=False)
+        self.assertIsNone(pandas_ta.pgo_batch(highs.iloc[:10], lows.iloc[:10], closes.iloc[:10]))
+        self.assertIsNone(pandas_ta.pgo_batch(highs, lows, closes[["a"]]))
+
     def test_ppo(self):
         result = pandas_ta.ppo(self.close, talib=False)
         self.assertIsInstance(result, DataFrame)
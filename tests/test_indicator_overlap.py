@@ -95,6 +95,20 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "FWMA_10")
 
+    def test_fwma_engine(self):
+        # The positional offset keeps its place ahead of the engine arguments
+        pdt.assert_series_equal(pandas_ta.fwma(self.close, 10, True, 3), pandas_ta.fwma(self.close, 10, offset=3))
+
+        close = self.close.copy()
+        for nans in [[], [5, 300, 301, 2000]]:
+            close.iloc[nans] = None
+            expected = pandas_ta.fwma(close)
+            result = pandas_ta.fwma(close, engine="numba")
+            pdt.assert_series_equal(result, expected)
+
+            result = pandas_ta.fwma(close, engine="numba", engine_kwargs={"parallel": True})
+            pdt.assert_series_equal(result, expected)
+
     def test_hilo(self):
         result = pandas_ta.hilo(self.high, self.low, self.close)
         self.assertIsInstance(result, DataFrame)
@@ -365,6 +379,51 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "T3_10_0.7")
 
+    def test_t3_dtype(self):
+        expected = pandas_ta.t3(self.close, talib=False)
+        result = pandas_ta.t3(self.close, talib=False, dtype="float32")
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.dtype, "float64")
+        self.assertEqual(result.name, "T3_10_0.7")
+        pdt.assert_series_equal(result, expected, rtol=5e-6)
+
+        # NaNs fall back to the float64 ema() chain
+        close = self.close.copy()
+        close.iloc[300] = None
+        result = pandas_ta.t3(close, talib=False, dtype="float32")
+        pdt.assert_series_equal(result, pandas_ta.t3(close, talib=False), check_exact=True)
+
+    def test_t3_nan(self):
+        close = self.close.copy()
+        close.iloc[[5, 300]] = None
+        result = pandas_ta.t3(close, talib=False)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "T3_10_0.7")
+
+        e1 = pandas_ta.ema(close, 10, talib=False)
+        e2 = pandas_ta.ema(e1, 10, talib=False)
+        e3 = pandas_ta.ema(e2, 10, talib=False)
+        e4 = pandas_ta.ema(e3, 10, talib=False)
+        e5 = pandas_ta.ema(e4, 10, talib=False)
+        e6 = pandas_ta.ema(e5, 10, talib=False)
+        a = 0.7
+        c1, c2, c3, c4 = -a ** 3, 3 * a ** 2 + 3 * a ** 3, -6 * a ** 2 - 3 * a - 3 * a ** 3, a ** 3 + 3 * a ** 2 + 3 * a + 1
+        expected = c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+        pdt.assert_series_equal(result, expected, check_names=False)
+        self.assertEqual(result.isna().sum(), 9)
+
+    def test_t3_batch(self):
+        closes = DataFrame({"a": self.close, "b": 2 * self.close})
+        result = pandas_ta.t3_batch(closes)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "T3_10_0.7")
+        pdt.assert_series_equal(result["b"], pandas_ta.t3(closes["b"], talib=False), check_names=False)
+
+        closes.iloc[[5, 300], 0] = None
+        result = pandas_ta.t3_batch(closes)
+        pdt.assert_series_equal(result["a"], pandas_ta.t3(closes["a"], talib=False), check_names=False)
+        self.assertIsNone(pandas_ta.t3_batch(closes.iloc[:5]))
+
     def test_tema(self):
         result = pandas_ta.tema(self.close, talib=False)
         self.assertIsInstance(result, Series)
@@ -408,6 +467,34 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "VIDYA_14")
 
+    def test_vidya_dtype(self):
+        expected = pandas_ta.vidya(self.close)
+        result = pandas_ta.vidya(self.close, dtype="float32")
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.dtype, "float64")
+        self.assertEqual(result.name, "VIDYA_14")
+        pdt.assert_series_equal(result, expected, rtol=1e-6)
+
+    def test_vidya_drift(self):
+        # Forward differences leave the last bar without a CMO
+        result = pandas_ta.vidya(self.close, drift=-1)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.name, "VIDYA_14")
+        self.assertEqual(result.isna().sum(), 15)
+        self.assertTrue(result.iloc[-1] != result.iloc[-1])
+
+    def test_vidya_batch(self):
+        closes = DataFrame({"a": self.close, "b": 2 * self.close})
+        result = pandas_ta.vidya_batch(closes)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "VIDYA_14")
+        pdt.assert_series_equal(result["b"], pandas_ta.vidya(closes["b"]), check_names=False)
+
+        result = pandas_ta.vidya_batch(closes, drift=-1)
+        pdt.assert_series_equal(result["b"], pandas_ta.vidya(closes["b"], drift=-1), check_names=False)
+        self.assertEqual(result["b"].isna().sum(), 15)
+        self.assertIsNone(pandas_ta.vidya_batch(closes.iloc[:10]))
+
     def test_vwap(self):
         result = pandas_ta.vwap(self.high, self.low, self.close, self.volume)
         self.assertIsInstance(result, Series)
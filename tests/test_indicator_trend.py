@@ -141,6 +141,21 @@ class TestTrend(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "DPO_20")
 
+    def test_dpo_engine(self):
+        # The positional offset keeps its place ahead of the engine arguments
+        pdt.assert_series_equal(pandas_ta.dpo(self.close, 20, True, 3), pandas_ta.dpo(self.close, 20, offset=3))
+
+        close = self.close.copy()
+        for nans in [[], [5, 300, 301, 2000]]:
+            close.iloc[nans] = None
+            for centered in [True, False]:
+                expected = pandas_ta.dpo(close, centered=centered)
+                result = pandas_ta.dpo(close, centered=centered, engine="numba")
+                pdt.assert_series_equal(result, expected)
+
+                result = pandas_ta.dpo(close, centered=centered, engine="numba", engine_kwargs={"nogil": True})
+                pdt.assert_series_equal(result, expected)
+
     def test_increasing(self):
         result = pandas_ta.increasing(self.close)
         self.assertIsInstance(result, Series)
@@ -161,6 +161,36 @@ class TestUtilities(TestCase):
     def test_df_year_to_date(self):
         result = self.utils.df_year_to_date(self.data)
 
+    def test_fast_fillna(self):
+        close = self.utils.fast_shift(self.data["close"], 5)
+        frame = DataFrame({"a": close, "b": -close})
+        for kwargs in [{"value": 0}, {"method": "ffill"}, {"method": "bfill"}]:
+            result = self.utils.fast_fillna(close.copy(), **kwargs)
+            self.assertIsInstance(result, Series)
+            npt.assert_array_equal(result.values, close.fillna(**kwargs).values)
+
+            result = self.utils.fast_fillna(frame, **kwargs)
+            self.assertIsInstance(result, DataFrame)
+            npt.assert_array_equal(result.values, frame.fillna(**kwargs).values)
+
+            readonly = close.to_numpy(copy=True)
+            readonly.flags.writeable = False
+            result = self.utils.fast_fillna(Series(readonly, index=close.index, name=close.name), **kwargs)
+            self.assertIsInstance(result, Series)
+            self.assertEqual(result.name, close.name)
+            npt.assert_array_equal(result.values, close.fillna(**kwargs).values)
+
+    def test_fast_shift(self):
+        close = self.data["close"]
+        for periods in [0, 1, 5, -1, -5, close.size, -close.size - 1]:
+            result = self.utils.fast_shift(close, periods)
+            self.assertIsInstance(result, Series)
+            self.assertEqual(result.name, close.name)
+            npt.assert_array_equal(result.values, close.shift(periods).values)
+
+        integers = Series([1, 2, 3, 4])
+        npt.assert_array_equal(self.utils.fast_shift(integers, 2).values, integers.shift(2).values)
+
     def test_fibonacci(self):
         self.assertIs(type(self.utils.fibonacci(zero=True, weighted=False)), np.ndarray)
 
@@ -263,6 +293,17 @@ class TestUtilities(TestCase):
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True), array_5w)
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True, inverse=True), array_5iw)
 
+    def test_sliding_weighted_ma(self):
+        close = self.data["close"]
+        w = self.utils.fibonacci(n=10, weighted=True)
+        result = self.utils.sliding_weighted_ma(close, w)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(result.size, close.size)
+        self.assertTrue(result.iloc[:9].isna().all())
+
+        expected = close.rolling(10).apply(self.utils.weights(w), raw=True)
+        npt.assert_allclose(result.values, expected.values)
+
     def test_symmetric_triangle(self):
         npt.assert_array_equal(self.utils.symmetric_triangle(), np.array([1,1]))
         npt.assert_array_equal(self.utils.symmetric_triangle(weighted=True), np.array([0.5, 0.5]))